@@ -7,20 +7,40 @@ A Telegram bot that:
 3. Tracks call numbers automatically
 """
 
+import asyncio
+import functools
 import logging
-from datetime import datetime, timedelta
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
 from typing import Optional
+from urllib.parse import urlencode
+from zoneinfo import ZoneInfo
 
-import pytz
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
 from telegram import Bot, Update
-from telegram.ext import Application, CommandHandler, ContextTypes, MessageHandler, filters
+from telegram.ext import AIORateLimiter, Application, CommandHandler, ContextTypes, MessageHandler, filters
 from telegram.constants import ParseMode
-from telegram.helpers import escape_markdown
 
-from config import Config, get_next_call_number, increment_call_number, load_call_state, save_call_state, invalidate_topics_cache
-from youtube_utils import get_latest_video_from_playlist
+from config import (
+    Config,
+    add_topic,
+    complete_call,
+    get_last_posted_video_id,
+    get_next_call_number,
+    get_next_call_number_async,
+    get_topics_formatted_cache,
+    get_state_snapshot,
+    load_call_state,
+    set_call_number,
+    set_topics_formatted_cache,
+    topics_cache_key,
+)
+from youtube_utils import (
+    VideoInfo,
+    get_cached_latest_video,
+    get_call_number_from_title,
+    invalidate_latest_video_cache,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -29,24 +49,103 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Store last posted video ID to avoid duplicates
-last_posted_video_id: Optional[str] = None
+
+@dataclass
+class BotState:
+    """Runtime state shared by handlers and scheduled jobs via application.bot_data["state"]."""
+    last_video_id: Optional[str] = None  # Last posted video, to avoid duplicates
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+# Last accepted invocation per (command handler, user), for throttle()
+_last_command_call: dict = {}
+
+
+def throttle(seconds: float):
+    """Decorator: let each user run a command handler at most once per given seconds."""
+    def decorator(handler):
+        @functools.wraps(handler)
+        async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+            key = (handler.__name__, update.effective_user.id)
+            now = time.monotonic()
+            if now - _last_command_call.get(key, float("-inf")) < seconds:
+                await update.message.reply_text("⏳ Please wait a few seconds before trying again.")
+                return
+            _last_command_call[key] = now
+            await handler(update, context)
+        return wrapper
+    return decorator
+
+
+# Defaults for messages sent to the group; link previews are only wanted for video posts
+DEFAULT_SEND_KWARGS = {"parse_mode": ParseMode.HTML, "disable_web_page_preview": True}
+
+# Timezone of the call schedule, resolved once
+_TZ = ZoneInfo(Config.TIMEZONE)
+
+# [unix timestamp, datetime] of the cached next call, reused until shortly before it starts
+_NEXT_CALL_CACHE = [0.0, None]
+
+# Backslash-escapes for the MarkdownV2 reserved characters (same set as
+# telegram.helpers.escape_markdown)
+_MDV2_TABLE = str.maketrans({c: f"\\{c}" for c in "\\_*[]()~`>#+-=|{}.!"})
+
+
+def _esc(text: str) -> str:
+    """Escape text for MarkdownV2."""
+    return text.translate(_MDV2_TABLE)
+
+
+def next_weekly(now: datetime, weekday: int, hour: int, minute: int = 0) -> datetime:
+    """Get the next occurrence of a weekly wall-clock time strictly after now.
+
+    Args:
+        now: Current time in the call timezone
+        weekday: Day of the week (0=Monday ... 6=Sunday)
+        hour: Hour of the day (24h format)
+        minute: Minute of the hour
+
+    Returns:
+        Timezone-aware datetime of the next occurrence
+    """
+    # Skip a full week when today's slot has already been reached
+    past = int((now.hour, now.minute, now.second, now.microsecond) >= (hour, minute, 0, 0))
+    days_ahead = (weekday - now.weekday() - past) % 7 + past
+
+    day = date.fromordinal(now.toordinal() + days_ahead)
+    return datetime(day.year, day.month, day.day, hour, minute, tzinfo=_TZ)
 
 
 def get_next_thursday() -> datetime:
-    """Get the next Thursday at 17:00 CET."""
-    tz = pytz.timezone(Config.TIMEZONE)
-    now = datetime.now(tz)
+    """Get the next Thursday at 17:00 CET.
 
-    days_until_thursday = (3 - now.weekday()) % 7
-    if days_until_thursday == 0 and now.hour >= 17:
-        days_until_thursday = 7
+    The result is reused until one minute before that call starts.
+    """
+    if time.time() < _NEXT_CALL_CACHE[0] - 60:
+        return _NEXT_CALL_CACHE[1]
+
+    next_call = next_weekly(datetime.now(_TZ), 3, Config.CALL_HOUR, Config.CALL_MINUTE)
 
-    next_call = now.replace(hour=17, minute=0, second=0, microsecond=0)
-    next_call += timedelta(days=days_until_thursday)
+    _NEXT_CALL_CACHE[:] = [next_call.timestamp(), next_call]
     return next_call
 
 
+# Google Calendar template URL with the per-call dates left off
+_CALENDAR_URL_PREFIX = "https://calendar.google.com/calendar/render?" + urlencode({
+    "action": "TEMPLATE",
+    "text": "Specter DIY Builder Call",
+    "details": "Weekly Specter DIY Builder community call. Discuss PRs, new ideas, and development.",
+    "location": Config.JITSI_LINK,
+})
+
+
+@functools.lru_cache(maxsize=16)
+def _format_call_date(day: date) -> tuple:
+    """Render a call date once as ("19.12", "Thursday, 19 December 2024")."""
+    return day.strftime("%d.%m"), day.strftime("%A, %d %B %Y")
+
+
+@functools.lru_cache(maxsize=8)
 def get_calendar_link_for_call(call_date: datetime) -> str:
     """Generate a Google Calendar link for a specific call date.
 
@@ -56,30 +155,56 @@ def get_calendar_link_for_call(call_date: datetime) -> str:
     Returns:
         Google Calendar template URL for adding the event
     """
-    from urllib.parse import urlencode
-
     # Format dates for Google Calendar (YYYYMMDDTHHMMSSZ in UTC)
     # Call is 17:00 CET = 16:00 UTC (or 15:00 UTC in summer)
-    start_utc = call_date.astimezone(pytz.UTC)
+    start_utc = call_date.astimezone(timezone.utc)
     end_utc = start_utc + timedelta(hours=2)  # 2-hour call
 
     start_str = start_utc.strftime("%Y%m%dT%H%M%SZ")
     end_str = end_utc.strftime("%Y%m%dT%H%M%SZ")
 
-    # Build Google Calendar template URL
-    params = {
-        "action": "TEMPLATE",
-        "text": "Specter DIY Builder Call",
-        "dates": f"{start_str}/{end_str}",
-        "details": "Weekly Specter DIY Builder community call. Discuss PRs, new ideas, and development.",
-        "location": Config.JITSI_LINK,
-    }
+    # Only the dates vary; "/" is a safe query character, so no encoding needed
+    return f"{_CALENDAR_URL_PREFIX}&dates={start_str}/{end_str}"
+
 
-    query = urlencode(params)
-    return f"https://calendar.google.com/calendar/render?{query}"
+def format_topics(topics: list, call_number: int, state: dict, use_ai: bool = True) -> str:
+    """Render the topic list for a message.
 
+    The AI-formatted text is cached in the call state, keyed by call number and topics.
+    Formatting may call Gemini, so async callers should run this in a worker thread.
 
-def format_message(template: str, call_date: Optional[datetime] = None, topics: list = None, use_ai_topics: bool = True) -> str:
+    Args:
+        topics: List of topic strings
+        call_number: Call number passed to the AI formatter
+        state: Call state snapshot holding topics_formatted_cache
+        use_ai: Whether to format topics with AI (default True)
+    """
+    if not topics:
+        return "No topics set yet."
+
+    # Simple bullet points
+    bullets = "\n".join(f"• {t}" for t in topics)
+    if not use_ai:
+        return bullets
+
+    # Keyed by content, so a topic list that recurs reuses its earlier formatting
+    key = topics_cache_key(call_number, topics)
+    cached = get_topics_formatted_cache(state, key)
+    if cached:
+        return cached
+
+    # Generate with AI; only real AI output is cached, so a failed or disabled
+    # Gemini call is retried by the next message instead of pinning the bullets
+    from youtube_utils import format_topics_with_ai
+    topic_str = format_topics_with_ai(topics, call_number)
+    if topic_str is None:
+        return bullets
+    set_topics_formatted_cache(key, topic_str)
+    return topic_str
+
+
+def format_message(template: str, call_date: Optional[datetime] = None, topics: list = None, use_ai_topics: bool = True,
+                   state: Optional[dict] = None) -> str:
     """Format a message template with call number, date, topics, and links.
 
     Args:
@@ -87,51 +212,67 @@ def format_message(template: str, call_date: Optional[datetime] = None, topics:
         call_date: Date of the call (defaults to next Thursday)
         topics: List of topic strings
         use_ai_topics: Whether to format topics with AI (default True)
+        state: Call state the caller already loaded (default: load it)
     """
-    call_number = get_next_call_number()
+    if state is None:
+        call_number, state = get_state_snapshot()
+    else:
+        call_number = get_next_call_number(state)
 
     if call_date is None:
         call_date = get_next_thursday()
 
-    # Format topics
-    if topics:
-        if use_ai_topics:
-            # Check cache first
-            state = load_call_state()
-            cached = state.get("topics_formatted_cache")
-
-            if cached:
-                topic_str = cached
-            else:
-                # Generate with AI and cache
-                from youtube_utils import format_topics_with_ai
-                topic_str = format_topics_with_ai(topics, call_number)
-                state["topics_formatted_cache"] = topic_str
-                save_call_state(state)
-        else:
-            # Simple bullet points
-            topic_str = "\n".join(f"• {t}" for t in topics)
-    else:
-        topic_str = "No topics set yet."
+    topic_str = format_topics(topics, call_number, state, use_ai_topics)
 
     # Generate dynamic calendar link
     calendar_link = get_calendar_link_for_call(call_date)
 
-    return template.format(
+    return _PARTIAL_TEMPLATES.get(template, template).format(
         call_number=call_number,
-        date=call_date.strftime("%d.%m"),
+        date=_format_call_date(call_date.date())[0],
         hour=Config.CALL_HOUR,
         minute=Config.CALL_MINUTE,
         topics=topic_str,
         calendar_link=calendar_link,
         jitsi_link=Config.JITSI_LINK,
-        youtube_link=f"https://www.youtube.com/@{Config.YOUTUBE_CHANNEL_ID}/live"
+        youtube_link=Config.YOUTUBE_LIVE_URL
+    )
+
+
+def _prefill_template(template: str) -> str:
+    """Substitute the fields of a message template that never change at runtime."""
+    return (
+        template
+        .replace("{hour:02d}", f"{Config.CALL_HOUR:02d}")
+        .replace("{minute:02d}", f"{Config.CALL_MINUTE:02d}")
+        .replace("{jitsi_link}", Config.JITSI_LINK)
+        .replace("{youtube_link}", Config.YOUTUBE_LIVE_URL)
     )
 
 
+# Reminder templates with their static fields already filled in, keyed by the original template
+_PARTIAL_TEMPLATES = {
+    template: _prefill_template(template)
+    for template in (
+        Config.REMINDER_MESSAGE_3_DAYS,
+        Config.REMINDER_MESSAGE_1_DAY,
+        Config.REMINDER_MESSAGE_1_HOUR,
+    )
+}
+
+
+# Admin user IDs of the configured group and their time.monotonic() expiry
+_admin_cache = {"ids": frozenset(), "expires": 0.0}
+
+# How long the group's admin list is reused, in seconds
+ADMIN_CACHE_TTL = 300
+
+
 async def is_user_admin(bot: Bot, user_id: int) -> bool:
     """Check if a user is an admin in the configured Telegram group.
 
+    The group's admin list is fetched in one call and reused for ADMIN_CACHE_TTL seconds.
+
     Args:
         bot: The Bot instance
         user_id: Telegram user ID to check
@@ -139,137 +280,160 @@ async def is_user_admin(bot: Bot, user_id: int) -> bool:
     Returns:
         True if user is admin or creator, False otherwise
     """
-    try:
-        chat_member = await bot.get_chat_member(
-            chat_id=Config.TELEGRAM_CHAT_ID,
-            user_id=user_id
-        )
-        return chat_member.status in ["creator", "administrator"]
-    except Exception as e:
-        logger.error(f"Failed to check admin status for user {user_id}: {e}")
-        return False
+    if time.monotonic() >= _admin_cache["expires"]:
+        try:
+            admins = await bot.get_chat_administrators(chat_id=Config.TELEGRAM_CHAT_ID)
+        except Exception as e:
+            logger.error(f"Failed to check admin status for user {user_id}: {e}")
+            return False
+        _admin_cache["ids"] = frozenset(member.user.id for member in admins)
+        _admin_cache["expires"] = time.monotonic() + ADMIN_CACHE_TTL
+
+    return user_id in _admin_cache["ids"]
 
 
-async def send_reminder(bot: Bot, template: str) -> None:
-    """Send a reminder message to the configured chat."""
-    state = load_call_state()
+async def send_reminder(bot: Bot, template: str, silent: bool = False) -> None:
+    """Send a reminder message to the configured chat.
+
+    Args:
+        bot: The Bot instance
+        template: Reminder message template
+        silent: Deliver without a notification sound (default False)
+    """
+    state = await asyncio.to_thread(load_call_state)
     topics = state.get("topics", [])
-    message = format_message(template, topics=topics)
+    # format_message may read/write call_state.json and call YouTube/Gemini
+    message = await asyncio.to_thread(format_message, template, topics=topics, state=state)
 
     try:
         await bot.send_message(
             chat_id=Config.TELEGRAM_CHAT_ID,
             text=message,
-            parse_mode=ParseMode.HTML,
-            disable_web_page_preview=True,
+            disable_notification=silent,
+            **DEFAULT_SEND_KWARGS,
         )
         logger.info(f"Reminder sent successfully with template: {template[:30]}")
     except Exception as e:
         logger.error(f"Failed to send reminder: {e}")
 
 
-async def send_3_day_reminder(bot: Bot) -> None:
-    """Send the 3-day reminder."""
-    logger.info("Sending 3-day reminder...")
-    await send_reminder(bot, Config.REMINDER_MESSAGE_3_DAYS)
-
-
-async def send_1_day_reminder(bot: Bot) -> None:
-    """Send the 1-day reminder."""
-    logger.info("Sending 1-day reminder...")
-    await send_reminder(bot, Config.REMINDER_MESSAGE_1_DAY)
+def build_post_message(video: VideoInfo, call_number: int, summary: str) -> str:
+    """Build the MarkdownV2 recording post for a video and its summary."""
+    return Config.POST_CALL_MESSAGE_TEMPLATE.format(
+        call_number=_esc(str(call_number)),
+        title=_esc(video.title),
+        summary=_esc(summary),
+        url=_esc(video.url),
+    )
 
 
-async def send_1_hour_reminder(bot: Bot) -> None:
-    """Send the 1-hour reminder."""
-    logger.info("Sending 1-hour reminder...")
-    await send_reminder(bot, Config.REMINDER_MESSAGE_1_HOUR)
+async def send_reminder_of(application: Application, template_attr: str, silent: bool = False) -> None:
+    """Send the reminder whose template is stored in the given Config attribute."""
+    logger.info(f"Sending reminder {template_attr}...")
+    await send_reminder(application.bot, getattr(Config, template_attr), silent=silent)
 
 
-async def check_and_post_new_video(bot: Bot) -> None:
-    """Check for new videos in the playlist and post them."""
-    global last_posted_video_id
+async def check_and_post_new_video(application: Application) -> None:
+    """Check for new videos in the playlist and post them.
 
-    logger.info("Checking for new videos in playlist...")
+    Runs under the shared BotState lock, so a /postvideo that collides with the
+    scheduled check cannot post the same video twice.
+    """
+    state: BotState = application.bot_data["state"]
 
-    video = get_latest_video_from_playlist(Config.YOUTUBE_PLAYLIST_ID)
+    async with state.lock:
+        logger.info("Checking for new videos in playlist...")
 
-    if not video:
-        logger.warning("Could not fetch latest video")
-        return
+        video = await asyncio.to_thread(get_cached_latest_video, Config.YOUTUBE_PLAYLIST_ID)
 
-    if video.video_id == last_posted_video_id:
-        logger.info(f"Video {video.video_id} already posted, skipping")
-        return
+        if not video:
+            logger.warning("Could not fetch latest video")
+            return
 
-    # Get current call number before incrementing
-    call_number = get_next_call_number()
+        if video.video_id == state.last_video_id:
+            logger.info(f"Video {video.video_id} already posted, skipping")
+            return
 
-    # Post the video
-    message = Config.POST_CALL_MESSAGE_TEMPLATE.format(
-        call_number=escape_markdown(str(call_number), version=2),
-        title=escape_markdown(video.title, version=2),
-        summary=escape_markdown(video.summary, version=2),
-        url=escape_markdown(video.url, version=2),
-    )
+        # The recording's title numbers the call it covers; without a number the
+        # playlist lookup (which may wait on YouTube) runs alongside the Gemini summary
+        posted_number = get_call_number_from_title(video.title)
+        if posted_number:
+            call_number, summary = posted_number, await video.summarize()
+        else:
+            next_number, summary = await asyncio.gather(
+                get_next_call_number_async(), video.summarize()
+            )
+            call_number = max(next_number - 1, 1)
+        message = build_post_message(video, call_number, summary)
 
-    try:
-        await bot.send_message(
-            chat_id=Config.TELEGRAM_CHAT_ID,
-            text=message,
-            parse_mode=ParseMode.MARKDOWN_V2,
-            disable_web_page_preview=False,
-        )
-        last_posted_video_id = video.video_id
-        logger.info(f"Posted new video: {video.title}")
+        try:
+            await application.bot.send_message(
+                chat_id=Config.TELEGRAM_CHAT_ID,
+                text=message,
+                parse_mode=ParseMode.MARKDOWN_V2,
+                disable_web_page_preview=False,
+            )
+            state.last_video_id = video.video_id
+            logger.info(f"Posted new video: {video.title}")
+
+            # The stored fallback number follows the playlist instead of
+            # drifting from a blind increment
+            new_number = await asyncio.to_thread(
+                complete_call, video.video_id, posted_number + 1 if posted_number else None
+            )
+            logger.info(f"Next call number is #{new_number}")
+        except Exception as e:
+            logger.error(f"Failed to post video: {e}")
+
+
+# Static command replies, built once at import
+_START_TEMPLATE = (
+    "Hello! I'm the Specter DIY Builder Bot.\n\n"
+    "I automatically send reminders for the weekly call "
+    "and post links to the recordings.\n\n"
+    "Next call: #{call_number}\n\n"
+    "Commands:\n"
+    "/help - Show this help message\n"
+    "/status - Show bot status\n"
+    "/nextcall - Show next call info\n"
+    "/latestvideo - Show latest video\n"
+    "/callnumber - Show/set call number\n"
+    "/chatid - Show chat ID (for setup)"
+)
 
-        # Increment call number for next week
-        new_number = increment_call_number()
-        logger.info(f"Call number incremented to #{new_number}")
-    except Exception as e:
-        logger.error(f"Failed to post video: {e}")
+_HELP_TEXT = (
+    "I'm the Specter DIY Builder Bot! Here's what I can do:\n\n"
+    "*Core Purpose:*\n"
+    "I help the Specter DIY Builder community by automating call reminders and sharing recordings.\n\n"
+    "*Automated Tasks:*\n"
+    "- Send reminders 3 days, 1 day, and 1 hour before the weekly call (Thursdays 17:00 CET).\n"
+    "- After the call, I find the latest video in our YouTube playlist and post it here with a summary.\n"
+    "- I automatically keep track of the call number.\n\n"
+    "*Available Commands:*\n"
+    "`/start` - Welcome message.\n"
+    "`/help` - You are here.\n"
+    "`/status` - Shows if I'm running correctly and the current time.\n"
+    "`/nextcall` - Displays the date, time, and a countdown to the next call.\n"
+    "`/topic <text>` - (Admin) Add a topic for the next call. You can also forward messages to the bot to add them as topics.\n"
+    "`/latestvideo` - Fetches and displays the most recent video from the playlist.\n"
+    "`/postvideo` - (Admin) Manually triggers posting the latest video.\n"
+    "`/callnumber [number]` - Shows the current call number. An admin can also set a new one (e.g., `/callnumber 42`).\n"
+    "`/chatid` - Shows the ID of this chat (required for initial setup).\n\n"
+    "My code is open-source! You can find it on GitHub."
+)
 
 
 # Command handlers
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /start command."""
-    call_number = get_next_call_number()
-    await update.message.reply_text(
-        f"Hello! I'm the Specter DIY Builder Bot.\n\n"
-        f"I automatically send reminders for the weekly call "
-        f"and post links to the recordings.\n\n"
-        f"Next call: #{call_number}\n\n"
-        f"Commands:\n"
-        f"/help - Show this help message\n"
-        f"/status - Show bot status\n"
-        f"/nextcall - Show next call info\n"
-        f"/latestvideo - Show latest video\n"
-        f"/callnumber - Show/set call number\n"
-        f"/chatid - Show chat ID (for setup)"
-    )
+    call_number = await get_next_call_number_async()
+    await update.message.reply_text(_START_TEMPLATE.format(call_number=call_number))
 
 
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /help command."""
     await update.message.reply_text(
-        "I'm the Specter DIY Builder Bot! Here's what I can do:\n\n"
-        "*Core Purpose:*\n"
-        "I help the Specter DIY Builder community by automating call reminders and sharing recordings.\n\n"
-        "*Automated Tasks:*\n"
-        "- Send reminders 3 days, 1 day, and 1 hour before the weekly call (Thursdays 17:00 CET).\n"
-        "- After the call, I find the latest video in our YouTube playlist and post it here with a summary.\n"
-        "- I automatically keep track of the call number.\n\n"
-        "*Available Commands:*\n"
-        "`/start` - Welcome message.\n"
-        "`/help` - You are here.\n"
-        "`/status` - Shows if I'm running correctly and the current time.\n"
-        "`/nextcall` - Displays the date, time, and a countdown to the next call.\n"
-        "`/topic <text>` - (Admin) Add a topic for the next call. You can also forward messages to the bot to add them as topics.\n"
-        "`/latestvideo` - Fetches and displays the most recent video from the playlist.\n"
-        "`/postvideo` - (Admin) Manually triggers posting the latest video.\n"
-        "`/callnumber [number]` - Shows the current call number. An admin can also set a new one (e.g., `/callnumber 42`).\n"
-        "`/chatid` - Shows the ID of this chat (required for initial setup).\n\n"
-        "My code is open-source! You can find it on GitHub.",
+        _HELP_TEXT,
         parse_mode=ParseMode.MARKDOWN,
         disable_web_page_preview=True,
     )
@@ -277,9 +441,8 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
 async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /status command."""
-    tz = pytz.timezone(Config.TIMEZONE)
-    now = datetime.now(tz)
-    call_number = get_next_call_number()
+    now = datetime.now(_TZ)
+    call_number = await get_next_call_number_async()
 
     await update.message.reply_text(
         f"*Bot Status*\n\n"
@@ -294,38 +457,31 @@ async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
 async def nextcall_info_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /nextcall command to show info."""
-    tz = pytz.timezone(Config.TIMEZONE)
-    now = datetime.now(tz)
     next_call = get_next_thursday()
-    call_number = get_next_call_number()
-    state = load_call_state()
+    call_number, state = await asyncio.to_thread(get_state_snapshot)
     topics = state.get("topics", [])
 
-    time_until = next_call - now
-    days = time_until.days
-    hours = time_until.seconds // 3600
-    minutes = (time_until.seconds % 3600) // 60
+    # Countdown from Unix timestamps (DST-safe, no datetime/timedelta arithmetic)
+    delta_s = max(0, int(next_call.timestamp() - time.time()))
+    days, rem = divmod(delta_s, 86400)
+    hours, rem = divmod(rem, 3600)
+    minutes = rem // 60
 
-    # Format topics - use AI summarization if topics exist
-    if topics:
-        from youtube_utils import format_topics_with_ai
-        topic_str = format_topics_with_ai(topics, call_number)
-    else:
-        topic_str = "No topics set yet."
+    # AI-formatted topics, reusing the cached text while the topics are unchanged
+    topic_str = await asyncio.to_thread(format_topics, topics, call_number, state)
 
     calendar_link = get_calendar_link_for_call(next_call)
 
     await update.message.reply_text(
         f"🗓️ Next Specter DIY Builder Call #{call_number}\n\n"
-        f"📅 Date: {next_call.strftime('%A, %d %B %Y')}\n"
+        f"📅 Date: {_format_call_date(next_call.date())[1]}\n"
         f"⏰ Time: {Config.CALL_HOUR}:{Config.CALL_MINUTE:02d} CET\n\n"
         f"⏳ Countdown: {days} days, {hours} hours, {minutes} minutes\n\n"
         f"📝 Topics:\n{topic_str}\n\n"
         f"🔗 Join the Call:\n"
         f'• <a href="{Config.JITSI_LINK}">Jitsi</a>\n'
         f'• <a href="{calendar_link}">Calendar</a>',
-        parse_mode=ParseMode.HTML,
-        disable_web_page_preview=True,
+        **DEFAULT_SEND_KWARGS,
     )
 
 
@@ -346,12 +502,7 @@ async def topic_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         )
         return
 
-    state = load_call_state()
-    topics = state.get("topics", [])
-    topics.append(topic)
-    state["topics"] = topics
-    save_call_state(state)
-    invalidate_topics_cache()
+    await asyncio.to_thread(add_topic, topic)
 
     await update.message.reply_text(f"✅ Topic added: \"{topic}\"")
 
@@ -365,28 +516,23 @@ async def handle_forwarded_message(update: Update, context: ContextTypes.DEFAULT
     message = update.message
 
     # Only process if message was forwarded
-    if not message.forward_date:
+    if not message.forward_origin:
         return
 
-    # Check if user is admin
-    user_id = update.effective_user.id
-    if not await is_user_admin(context.bot, user_id):
+    # Cheap checks first; the admin check may need a Telegram API call
+    topic_text = message.text or message.caption
+    if not topic_text:
         await message.reply_text(
-            "❌ Only group administrators can add topics via forwarded messages."
+            "❌ Could not extract text from forwarded message. "
+            "Please forward messages with text or captions."
         )
         return
 
-    # Extract text from forwarded message
-    topic_text = None
-
-    if message.text:
-        topic_text = message.text
-    elif message.caption:
-        topic_text = message.caption
-    else:
+    # Check if user is admin
+    user_id = update.effective_user.id
+    if not await is_user_admin(context.bot, user_id):
         await message.reply_text(
-            "❌ Could not extract text from forwarded message. "
-            "Please forward messages with text or captions."
+            "❌ Only group administrators can add topics via forwarded messages."
         )
         return
 
@@ -395,12 +541,7 @@ async def handle_forwarded_message(update: Update, context: ContextTypes.DEFAULT
         topic_text = topic_text[:500] + "..."
 
     # Add topic to state
-    state = load_call_state()
-    topics = state.get("topics", [])
-    topics.append(topic_text)
-    state["topics"] = topics
-    save_call_state(state)
-    invalidate_topics_cache()
+    await asyncio.to_thread(add_topic, topic_text)
 
     await message.reply_text(
         f"✅ Forwarded message added as topic:\n\n\"{topic_text[:100]}{'...' if len(topic_text) > 100 else ''}\""
@@ -408,23 +549,20 @@ async def handle_forwarded_message(update: Update, context: ContextTypes.DEFAULT
     logger.info(f"Topic added from forwarded message by user {user_id}: {topic_text[:50]}")
 
 
+@throttle(10)
 async def latest_video_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /latestvideo command."""
     await update.message.reply_text("🔎 Searching for the latest video...")
 
-    video = get_latest_video_from_playlist(Config.YOUTUBE_PLAYLIST_ID)
+    video = await asyncio.to_thread(get_cached_latest_video, Config.YOUTUBE_PLAYLIST_ID)
 
     if video:
-        call_number = get_next_call_number() - 1
-        if call_number < 1:
-            call_number = 1
-
-        message = Config.POST_CALL_MESSAGE_TEMPLATE.format(
-            call_number=escape_markdown(str(call_number), version=2),
-            title=escape_markdown(video.title, version=2),
-            summary=escape_markdown(video.summary, version=2),
-            url=escape_markdown(video.url, version=2),
+        next_number, summary = await asyncio.gather(
+            get_next_call_number_async(), video.summarize()
         )
+        call_number = max(next_number - 1, 1)
+
+        message = build_post_message(video, call_number, summary)
         await update.message.reply_text(message, parse_mode=ParseMode.MARKDOWN_V2)
     else:
         await update.message.reply_text("❌ Could not find any video in the playlist.")
@@ -438,15 +576,13 @@ async def chatid_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
 async def callnumber_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /callnumber command - show or set call number."""
-    call_number = get_next_call_number()
+    call_number = await get_next_call_number_async()
 
     if context.args and len(context.args) > 0:
         try:
             new_number = int(context.args[0])
             if new_number > 0:
-                state = load_call_state()
-                state["call_number"] = new_number
-                save_call_state(state)
+                await asyncio.to_thread(set_call_number, new_number)
                 await update.message.reply_text(f"✅ Call number updated to #{new_number}")
                 return
         except ValueError:
@@ -456,51 +592,142 @@ async def callnumber_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
     await update.message.reply_text(f"🔢 Current call number is #{call_number}.")
 
 
+@throttle(60)
 async def post_video_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /postvideo command - manually trigger video post."""
     await update.message.reply_text("⏳ Posting latest video...")
-    await check_and_post_new_video(context.bot)
+    invalidate_latest_video_cache(Config.YOUTUBE_PLAYLIST_ID)
+    await check_and_post_new_video(context.application)
 
 
-def setup_scheduler(bot: Bot) -> AsyncIOScheduler:
-    """Set up the scheduler for reminders and video checks."""
-    scheduler = AsyncIOScheduler(timezone=pytz.timezone(Config.TIMEZONE))
+# Reminder template attribute on Config (and silent flag) per Config.REMINDERS offset in hours
+REMINDER_TEMPLATES = {
+    72: ("REMINDER_MESSAGE_3_DAYS", True),  # 3 days before, silent
+    24: ("REMINDER_MESSAGE_1_DAY",),        # 1 day before
+    1: ("REMINDER_MESSAGE_1_HOUR",),        # 1 hour before
+}
+
+MINUTES_PER_WEEK = 7 * 24 * 60
+
+# How late a job may still run after the loop wakes up late (e.g. host suspend);
+# the video check is idempotent, so it gets a wider window
+MISFIRE_GRACE_SECONDS = 3600
+VIDEO_CHECK_GRACE_SECONDS = 6 * 3600
+
+
+def _weekly_slot(minute_of_week: int) -> tuple:
+    """Split a minute offset from Monday 00:00 into (weekday, hour, minute)."""
+    day, minute_of_day = divmod(minute_of_week % MINUTES_PER_WEEK, 24 * 60)
+    return (day, *divmod(minute_of_day, 60))
+
+
+def _build_weekly_jobs() -> list:
+    """Build the weekly job table from Config.REMINDERS and the Thursday call time.
+
+    Returns:
+        (weekday, hour, minute, name, coroutine function, extra args, misfire
+        grace in seconds) tuples in time-of-week order, weekday 0 = Monday
+    """
+    call_at = 3 * 24 * 60 + Config.CALL_HOUR * 60 + Config.CALL_MINUTE  # Thursday
+    jobs = []
 
-    # Schedule reminders
-    next_call_time = get_next_thursday()
     for hours_before in Config.REMINDERS:
-        reminder_time = next_call_time - timedelta(hours=hours_before)
-        job_id = f"reminder_{hours_before}h"
-
-        if hours_before == 72:
-            job_func = lambda: send_reminder(bot, Config.REMINDER_MESSAGE_3_DAYS)
-        elif hours_before == 24:
-            job_func = lambda: send_reminder(bot, Config.REMINDER_MESSAGE_1_DAY)
-        elif hours_before == 1:
-            job_func = lambda: send_reminder(bot, Config.REMINDER_MESSAGE_1_HOUR)
-        else:
+        args = REMINDER_TEMPLATES.get(hours_before)
+        if args is None:
+            logger.warning(f"No reminder template for {hours_before}h before the call, skipping")
             continue
+        slot = _weekly_slot(call_at - round(hours_before * 60))
+        jobs.append((*slot, f"{hours_before}h reminder", send_reminder_of, args, MISFIRE_GRACE_SECONDS))
+
+    # Friday 12:00, the day after the call
+    jobs.append((4, 12, 0, "Video check", check_and_post_new_video, (), VIDEO_CHECK_GRACE_SECONDS))
+    return sorted(jobs, key=lambda entry: entry[:3])
+
+
+WEEKLY_JOBS = _build_weekly_jobs()
+
+
+def build_schedule(application: Application) -> list:
+    """Bind WEEKLY_JOBS to the application as (weekday, hour, minute, name, job, grace) tuples."""
+    return [
+        (weekday, hour, minute, name, functools.partial(func, application, *args), grace)
+        for weekday, hour, minute, name, func, args, grace in WEEKLY_JOBS
+    ]
+
+
+# Scheduled jobs still running; the event loop only keeps weak references to tasks
+_running_jobs: set = set()
 
-        scheduler.add_job(
-            job_func,
-            "date",
-            run_date=reminder_time,
-            id=job_id,
-            name=f"{hours_before}h reminder",
+
+def _fire(job) -> None:
+    """Start a scheduled job in its own task and keep it referenced until it finishes."""
+    task = asyncio.create_task(job())
+    _running_jobs.add(task)
+    task.add_done_callback(_running_jobs.discard)
+
+
+async def scheduler_loop(application: Application) -> None:
+    """Sleep until the next scheduled job is due, run it, and repeat forever.
+
+    If the loop wakes up late, every job that came due meanwhile still runs once
+    if it is within its misfire grace; older ones are skipped with a warning.
+    """
+    schedule = build_schedule(application)
+    handled_until = datetime.now(_TZ)
+
+    while True:
+        due = sorted(
+            ((next_weekly(handled_until, weekday, hour, minute), name, job, grace)
+             for weekday, hour, minute, name, job, grace in schedule),
+            key=lambda entry: entry[0],
         )
+        next_fire, name = due[0][:2]
+        logger.info(f"Next scheduled job: {name} at {next_fire}")
 
-    # Schedule video check (day after call)
-    video_check_time = next_call_time + timedelta(days=1)
-    video_check_time = video_check_time.replace(hour=12, minute=0)
-    scheduler.add_job(
-        lambda: check_and_post_new_video(bot),
-        "date",
-        run_date=video_check_time,
-        id="video_check",
-        name="Video check",
-    )
+        await asyncio.sleep(max(0.0, next_fire.timestamp() - time.time()))
+
+        # Woke up early (e.g. clock adjustment) - recompute the remaining delay
+        now = datetime.now(_TZ)
+        if now < next_fire:
+            continue
+
+        for fire_at, name, job, grace in due:
+            if fire_at > now:
+                break
+            late = now.timestamp() - fire_at.timestamp()
+            if late > grace:
+                logger.warning(f"Skipping scheduled job: {name} missed by {int(late)}s")
+                continue
+            logger.info(f"Running scheduled job: {name}")
+            _fire(job)
 
-    return scheduler
+        handled_until = now
+
+
+async def post_init(application: Application) -> None:
+    """Start the scheduler loop once the application's event loop is running."""
+    # Python 3.12+: run new tasks eagerly up to their first real suspension
+    # instead of deferring them to the next loop iteration
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    if Config.is_fully_configured():
+        logger.info("Bot is fully configured. Starting scheduler...")
+        application.bot_data["scheduler_task"] = asyncio.create_task(scheduler_loop(application))
+    else:
+        logger.warning("SETUP MODE: Chat ID not set. Run /chatid in your group.")
+
+
+async def post_shutdown(application: Application) -> None:
+    """Stop the scheduler loop and any running jobs before the event loop closes."""
+    tasks = [*_running_jobs]
+    scheduler_task = application.bot_data.pop("scheduler_task", None)
+    if scheduler_task:
+        tasks.append(scheduler_task)
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
 
 
 def main() -> None:
@@ -511,7 +738,42 @@ def main() -> None:
         logger.error(f"Configuration error: {e}")
         return
 
-    application = Application.builder().token(Config.TELEGRAM_BOT_TOKEN).build()
+    # Use uvloop's libuv-based event loop where available (not on Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        logger.info("uvloop not installed, using default asyncio event loop")
+
+    # Bot API calls and the getUpdates long-poll use separate HTTP clients. Sends
+    # use HTTP/2 so concurrent replies multiplex over one connection; the long
+    # poll stays on PTB's HTTP/1.1 default, since h2 has known problems with
+    # cancelled keep-alive connections (PTB #3556) and one poll gains nothing
+    application = (
+        Application.builder()
+        .token(Config.TELEGRAM_BOT_TOKEN)
+        .http_version("2")
+        # Keep PTB's default pool size (256); wait at most 1s for a free pooled
+        # connection and cap connect/read/write so a stalled request fails instead of hanging
+        .pool_timeout(1.0)
+        .connect_timeout(5.0)
+        .read_timeout(10.0)
+        .write_timeout(10.0)
+        # Paces all Bot API calls (30/s overall, 20/min per group) and retries
+        # once after a 429 RetryAfter instead of failing the send
+        .rate_limiter(AIORateLimiter(
+            overall_max_rate=30,
+            overall_time_period=1,
+            group_max_rate=20,
+            group_time_period=60,
+            max_retries=1,
+        ))
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .build()
+    )
+    application.bot_data["state"] = BotState(last_video_id=get_last_posted_video_id())
 
     # Add command handlers
     application.add_handler(CommandHandler("start", start_command))
@@ -524,25 +786,38 @@ def main() -> None:
     application.add_handler(CommandHandler("callnumber", callnumber_command))
     application.add_handler(CommandHandler("postvideo", post_video_command))
 
-    # Add message handler for forwarded messages
+    # Add message handler for forwarded messages, only in DMs and the configured group
+    forward_chats = filters.ChatType.PRIVATE
+    if Config.TELEGRAM_CHAT_ID and Config.TELEGRAM_CHAT_ID.lstrip("-").isdigit():
+        forward_chats |= filters.Chat(chat_id=int(Config.TELEGRAM_CHAT_ID))
     application.add_handler(
         MessageHandler(
-            filters.FORWARDED & (filters.TEXT | filters.CAPTION),
+            filters.FORWARDED & (filters.TEXT | filters.CAPTION) & forward_chats,
             handle_forwarded_message
         )
     )
 
-    if Config.is_fully_configured():
-        logger.info("Bot is fully configured. Starting scheduler...")
-        scheduler = setup_scheduler(application.bot)
-        scheduler.start()
-        for job in scheduler.get_jobs():
-            logger.info(f"Scheduled job: {job.name} at {job.next_run_time}")
+    # Only plain messages are handled (commands and forwards); skip every other update type
+    allowed_updates = [Update.MESSAGE]
+
+    if Config.USE_WEBHOOK:
+        if not Config.WEBHOOK_SECRET_TOKEN:
+            logger.warning(
+                "WEBHOOK_SECRET_TOKEN is not set; the webhook will accept updates "
+                "without checking the X-Telegram-Bot-Api-Secret-Token header"
+            )
+        logger.info(f"Bot is running (webhook on port {Config.WEBHOOK_PORT})...")
+        application.run_webhook(
+            listen="0.0.0.0",
+            port=Config.WEBHOOK_PORT,
+            url_path=Config.TELEGRAM_BOT_TOKEN,
+            webhook_url=f"{Config.WEBHOOK_URL}/{Config.TELEGRAM_BOT_TOKEN}",
+            secret_token=Config.WEBHOOK_SECRET_TOKEN,
+            allowed_updates=allowed_updates,
+        )
     else:
-        logger.warning("SETUP MODE: Chat ID not set. Run /chatid in your group.")
-
-    logger.info("Bot is running...")
-    application.run_polling()
+        logger.info("Bot is running (polling)...")
+        application.run_polling(allowed_updates=allowed_updates)
 
 
 if __name__ == "__main__":
@@ -1,74 +1,235 @@
 """Configuration management for the Specter DIY Builder Bot."""
 
+import asyncio
+import copy
+import hashlib
 import os
 import json
+import threading
+import time
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
-# Import after Config is needed, so we'll handle circular import carefully
-_youtube_utils = None
+# Playlist-derived next call number and its time.monotonic() expiry
+_call_number_cache = {"value": None, "expires": 0.0}
 
 # Path for storing call state (number, topics, etc.)
 STATE_FILE = Path(__file__).parent / "call_state.json"
 
+# Serializes load-modify-save cycles; handlers run them in worker threads
+_state_lock = threading.RLock()
+
+# Most AI-formatted topic texts kept in call_state.json (oldest dropped first)
+TOPICS_CACHE_SIZE = 16
+
+# Last parsed call_state.json and the mtime (in ns) it was read at
+_STATE_CACHE = {"mtime_ns": 0, "data": None}
+
 
 def load_call_state() -> dict:
-    """Load the current call state from file."""
-    if STATE_FILE.exists():
-        with open(STATE_FILE, "r") as f:
-            return json.load(f)
-    return {"call_number": 9, "topics": []}  # Default starting number
+    """Load the current call state from file.
+
+    The parsed file is cached and only re-read when its mtime changes.
+    """
+    try:
+        mtime_ns = STATE_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {"call_number": 9, "topics": []}  # Default starting number
+
+    if _STATE_CACHE["data"] is None or _STATE_CACHE["mtime_ns"] != mtime_ns:
+        data = STATE_FILE.read_bytes()
+        _STATE_CACHE["data"] = orjson.loads(data) if orjson else json.loads(data)
+        _STATE_CACHE["mtime_ns"] = mtime_ns
+
+    # Callers mutate the returned dict before saving it
+    return copy.deepcopy(_STATE_CACHE["data"])
 
 
 def save_call_state(state: dict) -> None:
-    """Save the call state to file."""
-    with open(STATE_FILE, "w") as f:
-        json.dump(state, f, indent=2)
+    """Save the call state to file (orjson when installed, stdlib json otherwise).
+
+    Writes to a temporary file first and swaps it in, so readers never see a
+    half-written file.
+    """
+    if orjson:
+        data = orjson.dumps(state, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(state, indent=2).encode()
+
+    tmp_file = STATE_FILE.with_name(STATE_FILE.name + ".tmp")
+    tmp_file.write_bytes(data)
+    os.replace(tmp_file, STATE_FILE)
+
+    _STATE_CACHE["data"] = copy.deepcopy(state)
+    _STATE_CACHE["mtime_ns"] = STATE_FILE.stat().st_mtime_ns
+
+
+def _with_state(mutator) -> dict:
+    """Run one load-mutate-save cycle on the call state under the state lock.
+
+    mutator(state) changes the state in place; returning False skips the write.
+
+    Returns:
+        The (possibly updated) call state
+    """
+    with _state_lock:
+        state = load_call_state()
+        if mutator(state) is not False:
+            save_call_state(state)
+    return state
+
+
+def get_state_snapshot() -> tuple:
+    """Get the next call number and the current call state together.
+
+    Returns:
+        (call_number, state) tuple
+    """
+    return get_next_call_number(), load_call_state()
 
 
-def get_next_call_number() -> int:
+def get_next_call_number(state: Optional[dict] = None) -> int:
     """
     Get the next call number from the latest video in the playlist.
     Extracts the call number from the video title (e.g., "Call #10").
     The next call number = latest call number + 1.
+
+    The playlist result is cached in memory for Config.CALL_NUMBER_TTL seconds
+    or until invalidate_call_number_cache().
+
+    Args:
+        state: Call state the caller already loaded, used as the fallback
+            when the playlist lookup fails (default: load it)
     """
-    global _youtube_utils
+    if time.monotonic() < _call_number_cache["expires"]:
+        return _call_number_cache["value"]
 
-    # Lazy import to avoid circular dependency
-    if _youtube_utils is None:
-        from youtube_utils import get_latest_call_number
-        _youtube_utils = get_latest_call_number
+    # Imported here to avoid a circular import (youtube_utils imports Config)
+    from youtube_utils import get_latest_call_number
 
     # Get the call number from the latest playlist video
-    playlist_id = os.getenv("YOUTUBE_PLAYLIST_ID", "PLn2qRQUAAg0zFWTWeuZVo05tUnOGAmWkm")
-    next_call = _youtube_utils(playlist_id)
+    next_call = get_latest_call_number(Config.YOUTUBE_PLAYLIST_ID)
 
     if next_call > 0:
+        _call_number_cache["value"] = next_call
+        _call_number_cache["expires"] = time.monotonic() + Config.CALL_NUMBER_TTL
         return next_call
 
     # Fallback to state file if playlist fetch fails
-    state = load_call_state()
+    if state is None:
+        state = load_call_state()
     return state.get("call_number", 1)
 
 
-def increment_call_number() -> int:
-    """Increment the call number after a call."""
-    state = load_call_state()
-    state["call_number"] = state.get("call_number", 9) + 1
-    state["topics"] = []  # Reset topics for next call
-    state["topics_formatted_cache"] = None  # Clear cache for next call
-    save_call_state(state)
-    return state["call_number"]
+async def get_next_call_number_async() -> int:
+    """Get the next call number from async code without blocking the event loop.
+
+    Cache hits return directly; a playlist lookup runs in a worker thread.
+    """
+    if time.monotonic() < _call_number_cache["expires"]:
+        return _call_number_cache["value"]
+    return await asyncio.to_thread(get_next_call_number)
+
+
+def invalidate_call_number_cache() -> None:
+    """Forget the cached call number so the next lookup asks the playlist again."""
+    _call_number_cache["expires"] = 0.0
 
 
-def invalidate_topics_cache() -> None:
-    """Clear the AI-formatted topics cache when topics are modified."""
-    state = load_call_state()
-    if "topics_formatted_cache" in state:
-        del state["topics_formatted_cache"]
-        save_call_state(state)
+def complete_call(posted_video_id: Optional[str] = None, next_call_number: Optional[int] = None) -> int:
+    """Reset the call state for the next call in a single write.
+
+    Args:
+        posted_video_id: Recording just posted for the call, stored as last_posted_video_id
+        next_call_number: Number of the next call, e.g. derived from the recording's
+            title; defaults to the stored call number + 1
+
+    Returns:
+        The stored next call number
+    """
+    def reset(state: dict) -> None:
+        if next_call_number is None:
+            state["call_number"] = state.get("call_number", 9) + 1
+        else:
+            state["call_number"] = next_call_number
+        if posted_video_id is not None:
+            state["last_posted_video_id"] = posted_video_id
+        state["topics"] = []  # Reset topics for next call
+        state["topics_formatted_cache"] = {}  # Old call number keys can't match again
+
+    invalidate_call_number_cache()
+    return _with_state(reset)["call_number"]
+
+
+def get_last_posted_video_id() -> Optional[str]:
+    """Get the ID of the last video posted to the chat, if any."""
+    return load_call_state().get("last_posted_video_id")
+
+
+def update_call_state(**fields) -> dict:
+    """Set top-level call state fields in one locked read-modify-write.
+
+    The file is left untouched when every field already has the given value.
+
+    Returns:
+        The updated call state
+    """
+    def apply(state: dict) -> bool:
+        if all(key in state and state[key] == value for key, value in fields.items()):
+            return False
+        state.update(fields)
+        return True
+
+    return _with_state(apply)
+
+
+def add_topic(topic: str) -> None:
+    """Add a topic for the next call."""
+    _with_state(lambda state: state.setdefault("topics", []).append(topic))
+
+
+def set_call_number(number: int) -> None:
+    """Store a call number set manually by an admin."""
+    update_call_state(call_number=number)
+    invalidate_call_number_cache()
+
+
+def topics_cache_key(call_number: int, topics: list) -> str:
+    """Content hash identifying one AI formatting of a topic list."""
+    payload = json.dumps([call_number, topics], ensure_ascii=False).encode()
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _topics_cache(state: dict) -> dict:
+    """Get the {key: text} topics cache from a state (older files stored a plain string)."""
+    cache = state.get("topics_formatted_cache")
+    return cache if isinstance(cache, dict) else {}
+
+
+def get_topics_formatted_cache(state: dict, key: str) -> Optional[str]:
+    """Get a previously stored AI-formatted topics text, if any."""
+    return _topics_cache(state).get(key)
+
+
+def set_topics_formatted_cache(key: str, text: str) -> None:
+    """Store the AI-formatted topics text for reuse by later messages."""
+    def store(state: dict) -> None:
+        cache = _topics_cache(state)
+        cache[key] = text
+        # Dicts keep insertion order, so the first keys are the oldest
+        for old_key in list(cache)[:-TOPICS_CACHE_SIZE]:
+            del cache[old_key]
+        state["topics_formatted_cache"] = cache
+
+    _with_state(store)
 
 
 class Config:
@@ -81,6 +242,18 @@ class Config:
     # Gemini
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 
+    # Summarize short descriptions locally with sumy's TextRank instead of
+    # Gemini (optional, needs `pip install sumy`)
+    USE_LOCAL_SUMMARIZER = os.getenv("USE_LOCAL_SUMMARIZER", "").lower() in ("1", "true", "yes")
+
+    # Webhook (optional) - when WEBHOOK_URL is set, Telegram pushes updates
+    # to this bot instead of the bot long-polling getUpdates
+    WEBHOOK_URL = os.getenv("WEBHOOK_URL", "").rstrip("/")
+    WEBHOOK_PORT = int(os.getenv("WEBHOOK_PORT", "8443"))
+    # A blank value in .env loads as "", which PTB would require as the header value
+    WEBHOOK_SECRET_TOKEN = os.getenv("WEBHOOK_SECRET_TOKEN") or None
+    USE_WEBHOOK = bool(WEBHOOK_URL)
+
     # YouTube
     YOUTUBE_CHANNEL_ID = os.getenv("YOUTUBE_CHANNEL_ID", "UCs_tO31-N62qAD_S7s_H-8w")
     YOUTUBE_PLAYLIST_ID = os.getenv(
@@ -88,6 +261,20 @@ class Config:
         "PLn2qRQUAAg0zFWTWeuZVo05tUnOGAmWkm"
     )
     YOUTUBE_PLAYLIST_URL = f"https://www.youtube.com/playlist?list={YOUTUBE_PLAYLIST_ID}"
+    YOUTUBE_LIVE_URL = f"https://www.youtube.com/@{YOUTUBE_CHANNEL_ID}/live"
+
+    # YouTube Data API key (optional) - when set, the latest playlist video is
+    # read with one playlistItems request instead of a yt-dlp extraction
+    YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
+
+    # How long the playlist-derived call number is reused, in seconds
+    CALL_NUMBER_TTL = int(os.getenv("CALL_NUMBER_TTL", "600"))
+
+    # How long the latest playlist video is reused, in seconds
+    PLAYLIST_CACHE_TTL = int(os.getenv("PLAYLIST_CACHE_TTL", "900"))
+
+    # How long resolved host addresses are reused, in seconds (0 = off, the default)
+    DNS_CACHE_TTL = int(os.getenv("DNS_CACHE_TTL", "0"))
 
     # Call Links
     # Calendar link is now generated dynamically in bot.py
@@ -1,49 +1,375 @@
 """YouTube utilities for fetching playlist and video data."""
 
-import yt_dlp
+import asyncio
+import hashlib
+import json
+import re
 import logging
-import google.generativeai as genai
+import os
+import socket
+import sqlite3
+import threading
+import time
 from typing import Optional
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import urlencode
+from urllib.request import urlopen
 
 from config import Config
 
 logger = logging.getLogger(__name__)
 
+# Call number patterns in title order of preference: "Call #10" (also "Call #10:"), then any "#10"
+_CALL_NUMBER_PATTERNS = (
+    re.compile(r'Call\s+#(\d+)'),
+    re.compile(r'#(\d+)'),
+)
+
+YOUTUBE_API_PLAYLIST_ITEMS = "https://www.googleapis.com/youtube/v3/playlistItems"
+
+# Description noise that costs Gemini input tokens without helping the summary:
+# links and chapter timestamps ("12:34", "1:02:03")
+_URL_RE = re.compile(r'https?://\S+')
+_TIMESTAMP_RE = re.compile(r'\b\d{1,2}:\d{2}(?::\d{2})?\b')
+_SPACES_RE = re.compile(r'[ \t]+')
+_BLANK_LINES_RE = re.compile(r'\s*\n\s*')
+
+# Longest cleaned description sent to Gemini, in characters
+SUMMARY_INPUT_CHARS = 2000
+
+# Cleaned descriptions shorter than this are summarized locally when
+# USE_LOCAL_SUMMARIZER is set; longer ones still go to Gemini
+LOCAL_SUMMARY_MAX_CHARS = 1500
+
+# Latest video per playlist: {playlist_id: (expires_at, VideoInfo)}
+_latest_video_cache: dict = {}
+# Held while refreshing, so concurrent callers wait for one fetch instead of each extracting
+_latest_video_lock = threading.Lock()
+
+GEMINI_MODEL = 'gemini-2.5-flash'
+
+# The key is read once from the environment at startup, so check it once too
+_GENAI_ENABLED = bool(Config.GEMINI_API_KEY)
+
+# Only metadata is read, never formats, so don't fetch the DASH/HLS manifests
+METADATA_EXTRACTOR_ARGS = {"youtube": {"skip": ["dash", "hls"]}}
+
+# Per-thread YoutubeDL instances: _ydl_local.instances = {repr of sorted options: YoutubeDL}
+_ydl_local = threading.local()
+
+# Resolved addresses when DNS_CACHE_TTL is set: {getaddrinfo args: (expires_at, result)}
+_dns_cache: dict = {}
+
+# Gemini model clients by system instruction, created on first use
+_gemini_models: dict = {}
+_gemini_lock = threading.Lock()
+
+# Gemini summaries by _summary_key(), least recently used first; failures are not stored
+_summary_cache: dict = {}
+SUMMARY_CACHE_SIZE = 128
+
+# On-disk copy of the summary cache, so restarts don't pay Gemini again for old videos
+SUMMARY_DB = Path(__file__).parent / "summaries.db"
+# Lazily opened connection to SUMMARY_DB
+_summary_db = {"conn": None}
+# Summaries are looked up and stored from worker threads; guards both
+# _summary_cache and the SUMMARY_DB connection
+_summary_lock = threading.Lock()
+
+# Summary instructions, sent once as the model's system instruction rather than
+# prepended to every description
+SUMMARY_PROMPT = (
+    "You are a helpful assistant for a software development community. "
+    "Create a VERY SHORT summary of a YouTube video description for a technical community call. "
+    "IMPORTANT RULES:\n"
+    "- Use EXACTLY 3 bullet points, no more, no less\n"
+    "- Each bullet point must be ONE sentence only\n"
+    "- DO NOT use bold formatting (**text**) or colons in bullet points\n"
+    "- Be extremely concise - focus only on the main technical topics\n"
+    "- Use simple format: * Main topic and brief description\n"
+    "- Ignore secondary details like links or resources"
+)
+
+
+# yt-dlp (hundreds of extractors) and google.generativeai (grpc/protobuf) are slow
+# to import, so both are imported on first use instead of at module load
+def _get_gemini_model(system_instruction: Optional[str] = None):
+    """Configure Gemini once and reuse one model client per system instruction."""
+    model = _gemini_models.get(system_instruction)
+    if model is not None:
+        return model
+    # Summaries run in worker threads, so build under a lock to configure only once
+    with _gemini_lock:
+        model = _gemini_models.get(system_instruction)
+        if model is None:
+            import google.generativeai as genai
+            if not _gemini_models:
+                genai.configure(api_key=Config.GEMINI_API_KEY)
+            model = genai.GenerativeModel(GEMINI_MODEL, system_instruction=system_instruction)
+            _gemini_models[system_instruction] = model
+    return model
+
+
+def _get_ydl(ydl_opts: dict):
+    """Return this thread's yt-dlp YoutubeDL for the given options.
+
+    Building a YoutubeDL sets up the extractor registry, cookie jar and
+    request handlers, so instances are reused instead of rebuilt per lookup.
+    A YoutubeDL is not safe to share between threads, so each worker thread
+    keeps its own; they are released together with the thread.
+    """
+    instances = getattr(_ydl_local, "instances", None)
+    if instances is None:
+        instances = _ydl_local.instances = {}
+    # Options may hold dicts (extractor_args), so key on their repr
+    key = repr(sorted(ydl_opts.items()))
+    ydl = instances.get(key)
+    if ydl is None:
+        # No yt-dlp plugins are used; skip scanning the plugin directories
+        os.environ.setdefault("YTDLP_NO_PLUGINS", "1")
+        import yt_dlp
+        ydl = instances[key] = yt_dlp.YoutubeDL(ydl_opts)
+    return ydl
+
+
+def _install_dns_cache(ttl: int) -> None:
+    """Serve repeated socket.getaddrinfo lookups from memory for ttl seconds.
+
+    yt-dlp resolves youtube.com for every request, and repeated lookups can
+    be slow or rate limited by the resolver. Failed lookups are not cached.
+    """
+    resolve = socket.getaddrinfo
+
+    def cached_getaddrinfo(host, port, *args, **kwargs):
+        key = (host, port, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        cached = _dns_cache.get(key)
+        if cached and now < cached[0]:
+            return cached[1]
+        result = resolve(host, port, *args, **kwargs)
+        _dns_cache[key] = (now + ttl, result)
+        return result
+
+    socket.getaddrinfo = cached_getaddrinfo
+
+
+if Config.DNS_CACHE_TTL > 0:
+    _install_dns_cache(Config.DNS_CACHE_TTL)
+
+
+def _summary_key(text: str) -> str:
+    """Hash model, prompt and description so a change to any of them misses the cache."""
+    return hashlib.sha256(f"{GEMINI_MODEL}\0{SUMMARY_PROMPT}\0{text}".encode()).hexdigest()
+
+
+def _clean(text: str) -> str:
+    """Strip links and timestamps from a description and cap its length for Gemini."""
+    text = _URL_RE.sub('', text)
+    text = _TIMESTAMP_RE.sub('', text)
+    # Keep one line per chapter/paragraph but drop the leftover padding
+    text = _BLANK_LINES_RE.sub('\n', _SPACES_RE.sub(' ', text)).strip()
+    if len(text) > SUMMARY_INPUT_CHARS:
+        # Cut on a word boundary
+        text = text[:SUMMARY_INPUT_CHARS].rsplit(None, 1)[0]
+    return text
+
+
+def _local_summarize(text: str, sentences: int = 3) -> Optional[str]:
+    """Pick the top sentences with sumy's TextRank, formatted like the Gemini bullets.
+
+    Returns None if sumy (or its tokenizer data) is unavailable, so the
+    caller can fall back to Gemini.
+    """
+    try:
+        from sumy.nlp.tokenizers import Tokenizer
+        from sumy.parsers.plaintext import PlaintextParser
+        from sumy.summarizers.text_rank import TextRankSummarizer
+
+        parser = PlaintextParser.from_string(text, Tokenizer("english"))
+        picked = TextRankSummarizer()(parser.document, sentences)
+        return "\n".join(f"* {sentence}" for sentence in picked) or None
+
+    except Exception as e:
+        logger.warning(f"Local summarizer unavailable, using Gemini: {e}")
+        return None
+
+
+def _fallback(text: str) -> str:
+    """Plain summary used when Gemini is unavailable: the description, cut to 500 chars."""
+    return text[:500].rstrip() + "..." if len(text) > 500 else text
+
+
+def _summary_db_conn() -> sqlite3.Connection:
+    """Open SUMMARY_DB on first use. Call with _summary_lock held."""
+    conn = _summary_db["conn"]
+    if conn is None:
+        conn = sqlite3.connect(SUMMARY_DB, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS summaries ("
+            "key TEXT PRIMARY KEY, model TEXT, summary TEXT, created_at REAL)"
+        )
+        _summary_db["conn"] = conn
+    return conn
+
+
+def _remember_summary(key: str, summary: str) -> None:
+    """Put a summary at the recent end of _summary_cache. Call with _summary_lock held."""
+    _summary_cache.pop(key, None)
+    _summary_cache[key] = summary
+    if len(_summary_cache) > SUMMARY_CACHE_SIZE:
+        del _summary_cache[next(iter(_summary_cache))]
+
+
+def _get_cached_summary(key: str) -> Optional[str]:
+    """Return a cached summary and mark it as recently used.
+
+    Falls back to SUMMARY_DB on a memory miss, e.g. after a restart.
+    """
+    with _summary_lock:
+        cached = _summary_cache.get(key)
+        if cached is None:
+            try:
+                row = _summary_db_conn().execute(
+                    "SELECT summary FROM summaries WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"Could not read summary cache {SUMMARY_DB}: {e}")
+                return None
+            if row is None:
+                return None
+            cached = row[0]
+        _remember_summary(key, cached)
+        return cached
+
+
+def _store_summary(key: str, summary: str) -> None:
+    """Cache a summary in memory and in SUMMARY_DB, dropping the least recently used in memory."""
+    with _summary_lock:
+        _remember_summary(key, summary)
+        try:
+            conn = _summary_db_conn()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO summaries (key, model, summary, created_at) VALUES (?, ?, ?, ?)",
+                    (key, GEMINI_MODEL, summary, time.time()),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not write summary cache {SUMMARY_DB}: {e}")
+
 
 def summarize_with_ai(text: str) -> str:
-    """Summarize text using Google's Gemini API."""
+    """Summarize text using Google's Gemini API (or sumy locally for short texts, if enabled)."""
     if not text:
         return "No content available to summarize."
 
-    if not Config.GEMINI_API_KEY:
+    prompt_text = _clean(text)
+
+    if Config.USE_LOCAL_SUMMARIZER and 0 < len(prompt_text) < LOCAL_SUMMARY_MAX_CHARS:
+        summary = _local_summarize(prompt_text)
+        if summary:
+            return summary
+
+    if not _GENAI_ENABLED:
         logger.warning("GEMINI_API_KEY is not configured. Skipping AI summary.")
-        return text[:500].strip() + "..." if len(text) > 500 else text
+        return _fallback(text)
 
-    try:
-        genai.configure(api_key=Config.GEMINI_API_KEY)
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        prompt = (
-            "You are a helpful assistant for a software development community. "
-            "Create a VERY SHORT summary of a YouTube video description for a technical community call. "
-            "IMPORTANT RULES:\n"
-            "- Use EXACTLY 3 bullet points, no more, no less\n"
-            "- Each bullet point must be ONE sentence only\n"
-            "- DO NOT use bold formatting (**text**) or colons in bullet points\n"
-            "- Be extremely concise - focus only on the main technical topics\n"
-            "- Use simple format: * Main topic and brief description\n"
-            "- Ignore secondary details like links or resources\n\n"
-            f"Summarize this:\n\n{text}"
-        )
-        response = model.generate_content(prompt)
-        return response.text.strip()
+    if not prompt_text:
+        # Nothing but links/timestamps: show them as-is rather than ask Gemini about nothing
+        return _fallback(text)
+
+    key = _summary_key(prompt_text)
+    cached = _get_cached_summary(key)
+    if cached is not None:
+        return cached
 
+    try:
+        model = _get_gemini_model(SUMMARY_PROMPT)
+        response = model.generate_content(f"Summarize this:\n\n{prompt_text}")
+        summary = response.text.strip()
     except Exception as e:
         logger.error(f"Error calling Gemini API: {e}")
-        return text[:500].strip() + "..." if len(text) > 500 else text
+        return _fallback(text)
+
+    _store_summary(key, summary)
+    return summary
+
+
+def summarize_many(texts: list) -> list:
+    """
+    Summarize several descriptions with a single Gemini request.
+
+    Cached descriptions are answered from the summary cache and only the
+    rest are sent, as one prompt asking for a JSON array of summaries.
 
+    Args:
+        texts: Video descriptions
 
-def format_topics_with_ai(topics: list, call_number: int) -> str:
+    Returns:
+        List of summaries, in input order
+    """
+    if len(texts) < 2 or not _GENAI_ENABLED:
+        return [summarize_with_ai(text) for text in texts]
+
+    results = [None] * len(texts)
+    # Descriptions still to summarize: {summary key: (cleaned text, [input indexes])}
+    pending = {}
+    for i, text in enumerate(texts):
+        prompt_text = _clean(text) if text else ""
+        local = Config.USE_LOCAL_SUMMARIZER and len(prompt_text) < LOCAL_SUMMARY_MAX_CHARS
+        if not prompt_text or local:
+            # Empty or locally summarized: no Gemini request needed
+            results[i] = summarize_with_ai(text)
+            continue
+        key = _summary_key(prompt_text)
+        cached = _get_cached_summary(key)
+        if cached is not None:
+            results[i] = cached
+        else:
+            pending.setdefault(key, (prompt_text, []))[1].append(i)
+
+    if len(pending) == 1:
+        (_, indexes), = pending.values()
+        summary = summarize_with_ai(texts[indexes[0]])
+        for i in indexes:
+            results[i] = summary
+        return results
+
+    if pending:
+        batch = list(pending.items())
+        videos = "".join(
+            f"\n---VIDEO {n}---\n{prompt_text}" for n, (prompt_text, _) in enumerate(pending.values(), 1)
+        )
+        try:
+            model = _get_gemini_model(SUMMARY_PROMPT)
+            response = model.generate_content(
+                f"Summarize each of the following {len(batch)} videos separately. "
+                f"Return a JSON array with one summary string per video, in order.\n{videos}",
+                generation_config={"response_mime_type": "application/json", "response_schema": list[str]},
+            )
+            summaries = json.loads(response.text)
+            if not isinstance(summaries, list) or len(summaries) != len(batch):
+                raise ValueError(f"expected {len(batch)} summaries, got {summaries!r:.100}")
+        except Exception as e:
+            logger.error(f"Error calling Gemini API for {len(batch)} summaries: {e}")
+            summaries = None
+
+        for n, (key, (_, indexes)) in enumerate(batch):
+            if summaries is None:
+                summary = _fallback(texts[indexes[0]])
+            else:
+                summary = str(summaries[n]).strip()
+                _store_summary(key, summary)
+            for i in indexes:
+                results[i] = summary
+
+    return results
+
+
+def format_topics_with_ai(topics: list, call_number: int) -> Optional[str]:
     """Format topics list into engaging English announcement text using Gemini AI.
 
     Args:
@@ -51,18 +377,18 @@ def format_topics_with_ai(topics: list, call_number: int) -> str:
         call_number: The call number for context
 
     Returns:
-        Engaging English text about the topics, or fallback bullet points
+        Engaging English text about the topics, or None if Gemini is not
+        configured or failed (so callers can fall back without caching it)
     """
     if not topics:
         return "No topics set yet."
 
-    if not Config.GEMINI_API_KEY:
+    if not _GENAI_ENABLED:
         logger.warning("GEMINI_API_KEY not configured. Using simple format.")
-        return "\n".join(f"• {t}" for t in topics)
+        return None
 
     try:
-        genai.configure(api_key=Config.GEMINI_API_KEY)
-        model = genai.GenerativeModel('gemini-2.5-flash')
+        model = _get_gemini_model()
 
         topics_text = "\n".join(f"- {t}" for t in topics)
 
@@ -90,11 +416,10 @@ def format_topics_with_ai(topics: list, call_number: int) -> str:
 
     except Exception as e:
         logger.error(f"Error calling Gemini API for topics: {e}")
-        # Fallback to simple bullet points
-        return "\n".join(f"• {t}" for t in topics)
+        return None
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoInfo:
     """Information about a YouTube video."""
     video_id: str
@@ -103,11 +428,73 @@ class VideoInfo:
     description: str
     upload_date: str
     duration: int
+    _summary: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
-    @property
-    def summary(self) -> str:
-        """Generate a summary using AI or fallback to simple extraction."""
-        return summarize_with_ai(self.description)
+    async def summarize(self) -> str:
+        """Generate a summary using AI or fallback to simple extraction (once per video).
+
+        The Gemini call blocks for seconds, so it runs in a worker thread.
+        """
+        if self._summary is None:
+            self._summary = await asyncio.to_thread(summarize_with_ai, self.description)
+        return self._summary
+
+
+def _get_latest_playlist_item(playlist_id: str, part: str, timeout: int = 10) -> Optional[dict]:
+    """
+    Fetch the latest playlist item with one YouTube Data API request.
+
+    Returns None when YOUTUBE_API_KEY is not set, the playlist is empty or the
+    request fails (e.g. quota exceeded), so callers can fall back to yt-dlp.
+    """
+    if not Config.YOUTUBE_API_KEY:
+        return None
+
+    query = urlencode({
+        "part": part,
+        "maxResults": 1,
+        "playlistId": playlist_id,
+        "key": Config.YOUTUBE_API_KEY,
+    })
+
+    try:
+        with urlopen(f"{YOUTUBE_API_PLAYLIST_ITEMS}?{query}", timeout=timeout) as response:
+            items = json.load(response).get("items") or ()
+
+        for item in items:
+            return item
+
+        logger.error("Playlist is empty")
+        return None
+
+    except Exception as e:
+        logger.warning(f"YouTube Data API request failed, falling back to yt-dlp: {e}")
+        return None
+
+
+def _get_latest_video_via_api(playlist_id: str, timeout: int = 10) -> Optional[VideoInfo]:
+    """
+    Fetch the latest playlist video from the YouTube Data API, or None to use yt-dlp.
+
+    The API does not report the duration here, so it is left at 0.
+    """
+    item = _get_latest_playlist_item(playlist_id, "snippet,contentDetails", timeout)
+    if item is None:
+        return None
+
+    snippet = item.get("snippet", {})
+    details = item.get("contentDetails", {})
+    video_id = details.get("videoId") or snippet.get("resourceId", {}).get("videoId", "")
+    # "2024-12-19T17:00:00Z" -> "20241219", the format yt-dlp uses
+    published = details.get("videoPublishedAt") or snippet.get("publishedAt", "")
+    return VideoInfo(
+        video_id=video_id,
+        title=snippet.get("title", "Unknown Title"),
+        url=f"https://www.youtube.com/watch?v={video_id}",
+        description=snippet.get("description", ""),
+        upload_date=published[:10].replace("-", ""),
+        duration=0,
+    )
 
 
 def get_latest_video_from_playlist(playlist_id: str, timeout: int = 10) -> Optional[VideoInfo]:
@@ -121,45 +508,134 @@ def get_latest_video_from_playlist(playlist_id: str, timeout: int = 10) -> Optio
     Returns:
         VideoInfo object or None if failed
     """
+    video = _get_latest_video_via_api(playlist_id, timeout)
+    if video:
+        return video
+
     playlist_url = f"https://www.youtube.com/playlist?list={playlist_id}"
 
     ydl_opts = {
         "quiet": True,
         "no_warnings": True,
         "extract_flat": False,
+        "extractor_args": METADATA_EXTRACTOR_ARGS,
         "playlistend": 1,  # Only get the first (latest) video
         "socket_timeout": timeout,
     }
 
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            result = ydl.extract_info(playlist_url, download=False)
+        ydl = _get_ydl(ydl_opts)
+        result = ydl.extract_info(playlist_url, download=False)
+
+        if not result or "entries" not in result:
+            logger.error("No entries found in playlist")
+            return None
+
+        # Only the first entry is needed; don't materialize the rest
+        video = next(iter(result["entries"]), None)
+        if video is None:
+            logger.error("Playlist is empty")
+            return None
+
+        return VideoInfo(
+            video_id=video.get("id", ""),
+            title=video.get("title", "Unknown Title"),
+            url=video.get("webpage_url", ""),
+            description=video.get("description", ""),
+            upload_date=video.get("upload_date", ""),
+            duration=video.get("duration", 0),
+        )
 
-            if not result or "entries" not in result:
-                logger.error("No entries found in playlist")
-                return None
+    except Exception as e:
+        logger.error(f"Error fetching playlist: {e}")
+        return None
 
-            entries = list(result["entries"])
-            if not entries:
-                logger.error("Playlist is empty")
-                return None
 
-            video = entries[0]
+def get_latest_video_id(playlist_id: str, timeout: int = 10) -> Optional[str]:
+    """
+    Fetch only the ID of the latest video in a playlist.
 
-            return VideoInfo(
-                video_id=video.get("id", ""),
-                title=video.get("title", "Unknown Title"),
-                url=video.get("webpage_url", ""),
-                description=video.get("description", ""),
-                upload_date=video.get("upload_date", ""),
-                duration=video.get("duration", 0),
-            )
+    Uses a flat extraction, so no per-video metadata is requested.
+
+    Args:
+        playlist_id: The YouTube playlist ID
+        timeout: Timeout in seconds (default 10s)
+
+    Returns:
+        Video ID or None if failed
+    """
+    # contentDetails alone carries the video ID, keeping the probe small
+    item = _get_latest_playlist_item(playlist_id, "contentDetails", timeout)
+    if item:
+        return item.get("contentDetails", {}).get("videoId") or None
+
+    playlist_url = f"https://www.youtube.com/playlist?list={playlist_id}"
+
+    ydl_opts = {
+        "quiet": True,
+        "no_warnings": True,
+        "extract_flat": "in_playlist",
+        "playlistend": 1,
+        "socket_timeout": timeout,
+    }
+
+    try:
+        ydl = _get_ydl(ydl_opts)
+        result = ydl.extract_info(playlist_url, download=False)
+
+        for entry in (result or {}).get("entries") or ():
+            return entry.get("id") or None
+        return None
 
     except Exception as e:
-        logger.error(f"Error fetching playlist: {e}")
+        logger.error(f"Error fetching latest video ID: {e}")
         return None
 
 
+def get_cached_latest_video(playlist_id: str, ttl: Optional[int] = None) -> Optional[VideoInfo]:
+    """
+    Fetch the latest video from a playlist, reusing the result for ttl seconds.
+
+    Args:
+        playlist_id: The YouTube playlist ID
+        ttl: How long a fetched video is reused, in seconds
+             (default Config.PLAYLIST_CACHE_TTL)
+
+    Returns:
+        VideoInfo object or None if failed
+    """
+    if ttl is None:
+        ttl = Config.PLAYLIST_CACHE_TTL
+
+    cached = _latest_video_cache.get(playlist_id)
+    if cached and time.monotonic() < cached[0]:
+        return cached[1]
+
+    with _latest_video_lock:
+        # Another thread may have refreshed it while we waited for the lock
+        now = time.monotonic()
+        cached = _latest_video_cache.get(playlist_id)
+        if cached and now < cached[0]:
+            return cached[1]
+
+        # Expired entry: a flat ID probe is enough to tell whether it is still the
+        # latest video; if so keep the existing object (and anything already
+        # computed on it) and just extend its lifetime, like a 304 revalidation
+        if cached and get_latest_video_id(playlist_id) == cached[1].video_id:
+            _latest_video_cache[playlist_id] = (now + ttl, cached[1])
+            return cached[1]
+
+        video = get_latest_video_from_playlist(playlist_id)
+        if video:
+            _latest_video_cache[playlist_id] = (now + ttl, video)
+        return video
+
+
+def invalidate_latest_video_cache(playlist_id: str) -> None:
+    """Drop the cached latest video so the next lookup fetches it again."""
+    _latest_video_cache.pop(playlist_id, None)
+
+
 def get_video_info(video_id: str) -> Optional[VideoInfo]:
     """
     Fetch information about a specific YouTube video.
@@ -175,29 +651,51 @@ def get_video_info(video_id: str) -> Optional[VideoInfo]:
     ydl_opts = {
         "quiet": True,
         "no_warnings": True,
+        "extractor_args": METADATA_EXTRACTOR_ARGS,
     }
 
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            video = ydl.extract_info(video_url, download=False)
-
-            if not video:
-                return None
-
-            return VideoInfo(
-                video_id=video.get("id", ""),
-                title=video.get("title", "Unknown Title"),
-                url=video.get("webpage_url", video_url),
-                description=video.get("description", ""),
-                upload_date=video.get("upload_date", ""),
-                duration=video.get("duration", 0),
-            )
+        ydl = _get_ydl(ydl_opts)
+        video = ydl.extract_info(video_url, download=False)
+
+        if not video:
+            return None
+
+        return VideoInfo(
+            video_id=video.get("id", ""),
+            title=video.get("title", "Unknown Title"),
+            url=video.get("webpage_url", video_url),
+            description=video.get("description", ""),
+            upload_date=video.get("upload_date", ""),
+            duration=video.get("duration", 0),
+        )
 
     except Exception as e:
         logger.error(f"Error fetching video info: {e}")
         return None
 
 
+def get_many_videos(video_ids: list, max_workers: int = 4) -> list:
+    """
+    Fetch information about several videos concurrently.
+
+    Each lookup is a network-bound yt-dlp extraction that releases the GIL
+    while waiting, so a small thread pool overlaps them.
+
+    Args:
+        video_ids: The YouTube video IDs
+        max_workers: Most extractions running at once (default 4)
+
+    Returns:
+        List of VideoInfo objects (None for failed lookups), in input order
+    """
+    if len(video_ids) < 2:
+        return [get_video_info(video_id) for video_id in video_ids]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(video_ids))) as executor:
+        return list(executor.map(get_video_info, video_ids))
+
+
 def get_call_number_from_title(title: str) -> Optional[int]:
     """
     Extract the call number from a video title.
@@ -209,21 +707,14 @@ def get_call_number_from_title(title: str) -> Optional[int]:
     Returns:
         Call number as integer, or None if not found
     """
-    import re
-
-    # Try patterns: "Call #10", "#10", "Call #10:"
-    patterns = [
-        r'Call\s+#(\d+)',
-        r'#(\d+)',
-    ]
+    # Both patterns need a "#", so most non-call titles skip the regex engine
+    if "#" not in title:
+        return None
 
-    for pattern in patterns:
-        match = re.search(pattern, title)
+    for pattern in _CALL_NUMBER_PATTERNS:
+        match = pattern.search(title)
         if match:
-            try:
-                return int(match.group(1))
-            except (ValueError, IndexError):
-                continue
+            return int(match.group(1))
 
     return None
 
@@ -238,45 +729,53 @@ def get_latest_call_number(playlist_id: str, timeout: int = 5) -> int:
         timeout: Timeout for yt-dlp in seconds (to avoid hanging)
 
     Returns:
-        Next call number (latest + 1), or 1 as fallback
+        Next call number (latest + 1), or 0 if it could not be determined
     """
+    video = _get_latest_video_via_api(playlist_id, timeout)
+    if video:
+        call_num = get_call_number_from_title(video.title)
+        if call_num is not None:
+            logger.info(f"Found call number {call_num} in latest video: {video.title}")
+            return call_num + 1
+        logger.warning(f"Could not extract call number from title: {video.title}")
+        return 0
+
     try:
         playlist_url = f"https://www.youtube.com/playlist?list={playlist_id}"
 
         ydl_opts = {
             "quiet": True,
             "no_warnings": True,
-            "extract_flat": False,
+            "extract_flat": "in_playlist",  # Only the title is needed, skip the video page
             "playlistend": 1,
             "socket_timeout": timeout,
         }
 
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            result = ydl.extract_info(playlist_url, download=False)
+        ydl = _get_ydl(ydl_opts)
+        result = ydl.extract_info(playlist_url, download=False)
 
-            if not result or "entries" not in result:
-                logger.warning(f"Could not fetch latest video from playlist {playlist_id}")
-                return 1
+        if not result or "entries" not in result:
+            logger.warning(f"Could not fetch latest video from playlist {playlist_id}")
+            return 0
 
-            entries = list(result["entries"])
-            if not entries:
-                logger.warning(f"Playlist {playlist_id} is empty")
-                return 1
+        video = next(iter(result["entries"]), None)
+        if video is None:
+            logger.warning(f"Playlist {playlist_id} is empty")
+            return 0
 
-            video = entries[0]
-            title = video.get("title", "")
-            call_num = get_call_number_from_title(title)
+        title = video.get("title", "")
+        call_num = get_call_number_from_title(title)
 
-            if call_num is not None:
-                logger.info(f"Found call number {call_num} in latest video: {title}")
-                return call_num + 1
+        if call_num is not None:
+            logger.info(f"Found call number {call_num} in latest video: {title}")
+            return call_num + 1
 
-            logger.warning(f"Could not extract call number from title: {title}")
-            return 1
+        logger.warning(f"Could not extract call number from title: {title}")
+        return 0
 
     except Exception as e:
         logger.warning(f"Error fetching playlist call number: {e}")
-        return 1
+        return 0
 
 
 if __name__ == "__main__":
@@ -291,6 +790,6 @@ if __name__ == "__main__":
         print(f"\nTitle: {video.title}")
         print(f"URL: {video.url}")
         print(f"Upload Date: {video.upload_date}")
-        print(f"\nSummary:\n{video.summary}")
+        print(f"\nSummary:\n{asyncio.run(video.summarize())}")
     else:
         print("Failed to fetch video")